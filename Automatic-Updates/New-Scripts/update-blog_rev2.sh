@@ -452,7 +452,7 @@ load_file_hashes() {
     file_hashes=()
     
     if [[ -f "$hash_file" ]]; then
-        while IFS=$'\t' read -r file hash; do
+        while IFS=$'\t' read -r file hash _; do
             file_hashes["$file"]=$hash
         done < "$hash_file"
         log_info "Caricati ${#file_hashes[@]} hash dal file $hash_file"
@@ -275,7 +275,7 @@ load_file_hashes() {
     typeset -A file_hashes
     
     if [[ -f "$hash_file" ]]; then
-        while IFS=$'\t' read -r file hash; do
+        while IFS=$'\t' read -r file hash _; do
             file_hashes["$file"]=$hash
         done < "$hash_file"
     fi
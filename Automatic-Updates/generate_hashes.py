@@ -2,87 +2,39 @@
 
 import sys
 import os
-import hashlib
+import logging
 
-HASH_FILE = ".file_hashes"
+from hashutil import bulk_sha256, get_markdown_files, save_hashes
 
-def calculate_hash(file_path):
-    """
-    Calculate the SHA-256 hash of a file.
-    Args:
-        file_path (str): The path to the file for which the hash is to be calculated.
-    Returns:
-        str: The SHA-256 hash of the file in hexadecimal format.
-    """
-    sha256 = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for block in iter(lambda: f.read(65536), b""):
-            sha256.update(block)
-    return sha256.hexdigest()
-
-def load_existing_hashes(hash_file):
-    """
-    Load existing file hashes from a given file.
-    This function reads a file containing file paths and their corresponding
-    hashes, separated by a tab character, and returns a dictionary where the
-    keys are file paths and the values are their respective hashes.
-    Args:
-        hash_file (str): The path to the file containing the hashes.
-    Returns:
-        dict: A dictionary with file paths as keys and their hashes as values.
-              If the file does not exist, an empty dictionary is returned.
-    """
-    if not os.path.exists(hash_file):
-        return {}
-    hashes = {}
-    with open(hash_file, "r", encoding="utf-8") as f:
-        for line in f:
-            file_path, file_hash = line.strip().split("\t")
-            hashes[file_path] = file_hash
-    return hashes
-
-def save_hashes(hash_file, hashes):
-    """
-    Save file paths and their corresponding hashes to a file.
-    Args:
-        hash_file (str): The path to the file where the hashes will be saved.
-        hashes (dict): A dictionary where keys are file paths and values are their corresponding hashes.
-    """
-    with open(hash_file, "w", encoding="utf-8") as f:
-        for file_path, file_hash in hashes.items():
-            f.write(f"{file_path}\t{file_hash}\n")
+HASH_FILE = ".file_hashes"
 
 def update_hashes(directory):
     """
     Updates the hash values of markdown files in the specified directory.
     This function walks through the given directory, calculates the hash values
-    of all markdown (.md) files, and updates the existing hash values stored in
-    a hash file. It also removes the hash values of files that are no longer present
-    in the directory.
+    of all markdown (.md) files, and rewrites the hash file with them. Entries for
+    files that are no longer present in the directory are dropped.
     Args:
         directory (str): The path to the directory containing markdown files.
     Returns:
-        dict: A dictionary containing the updated hash values of the markdown files.
+        dict: A dictionary containing the updated hash values of the markdown files,
+              or None if the hash file could not be written.
     """
-    existing_hashes = load_existing_hashes(HASH_FILE)
-    current_hashes = {}
+    entries = list(get_markdown_files(directory))
+    md_paths = [entry.path for entry in entries]
 
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(".md"):
-                file_path = os.path.join(root, file)
-                current_hash = calculate_hash(file_path)
-                current_hashes[file_path] = current_hash
+    # Stat before hashing, so a file edited while it is hashed looks changed on the next run
+    stats = [entry.stat() for entry in entries]
+    current_hashes = {
+        file_path: (file_hash, st.st_mtime_ns, st.st_size)
+        for file_path, st, file_hash in zip(md_paths, stats, bulk_sha256(md_paths, sum(st.st_size for st in stats)))
+        if file_hash is not None
+    }
 
-    # Remove hashes of files that are no longer present
-    updated_hashes = {**existing_hashes, **current_hashes}
-    for file_path in list(updated_hashes.keys()):
-        if file_path not in current_hashes:
-            del updated_hashes[file_path]
-
-    # Save updated hashes
-    save_hashes(HASH_FILE, updated_hashes)
-    return updated_hashes
+    # The current hashes replace the previous file entirely
+    if not save_hashes(current_hashes, HASH_FILE):
+        return None
+    return current_hashes
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
@@ -94,5 +46,8 @@ if __name__ == "__main__":
         print(f"Error: {directory} is not a valid directory.", file=sys.stderr)
         sys.exit(1)
 
+    logging.basicConfig(level=logging.INFO, format="[%(levelname)s] %(message)s", stream=sys.stdout)
     updated_hashes = update_hashes(directory)
+    if updated_hashes is None:
+        sys.exit(1)
     print(f"Updated hashes for {len(updated_hashes)} files.")
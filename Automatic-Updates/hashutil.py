@@ -0,0 +1,277 @@
+import os
+import csv
+import hashlib
+import logging
+import mmap
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+# Files larger than this are memory-mapped for hashing instead of read through a buffer
+MMAP_THRESHOLD = 1 << 20
+# Below this many bytes in total, hashing inline beats starting worker processes (spawned, not
+# forked, on macOS, so each one re-imports the interpreter and this module)
+PARALLEL_THRESHOLD = 32 << 20
+# Directories that never hold posts but can hold many files (dependencies, Hugo's build output);
+# hidden directories (.git, .obsidian, ...) are skipped as well
+SKIPPED_DIRECTORIES = frozenset({"node_modules", "public"})
+
+# ================================ #
+# Hashing
+
+def new_sha256():
+    """
+    Create a SHA-256 hash object through the OpenSSL EVP interface.
+
+    hashlib.new() always prefers the OpenSSL implementation (SHA-NI accelerated on
+    supporting CPUs), and usedforsecurity=False keeps it available on FIPS builds.
+
+    Returns:
+        hashlib._Hash: A new SHA-256 hash object.
+    """
+    return hashlib.new("sha256", usedforsecurity=False)
+
+def calculate_content_hash(content):
+    """
+    Calculate the SHA-256 hash of content already held in memory.
+
+    Args:
+        content (bytes): The exact bytes written to (or read from) a file.
+
+    Returns:
+        str: The SHA-256 hash of the content in hexadecimal format.
+    """
+    sha256 = new_sha256()
+    sha256.update(content)
+    return sha256.hexdigest()
+
+def calculate_hash(file_path):
+    """
+    Calculate the SHA-256 hash of a file.
+
+    Args:
+        file_path (str): The path to the file for which the hash is to be calculated.
+
+    Returns:
+        str: The SHA-256 hash of the file in hexadecimal format if successful.
+        None: If an error occurs during the hash calculation.
+    """
+    try:
+        # Unbuffered: file_digest and readinto fill their own buffers, a BufferedReader would only add a copy
+        with open(file_path, "rb", buffering=0) as f:
+            if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+                # Let the SHA engine read straight from the page cache, without copying into a buffer
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    sha256 = new_sha256()
+                    sha256.update(mm)
+                    return sha256.hexdigest()
+            if hasattr(hashlib, "file_digest"):
+                return hashlib.file_digest(f, new_sha256).hexdigest()
+            # Python < 3.11: reuse a single buffer instead of allocating a bytes object per block
+            sha256 = new_sha256()
+            buffer = memoryview(bytearray(1 << 20))
+            size = f.readinto(buffer)
+            while size:
+                sha256.update(buffer[:size])
+                size = f.readinto(buffer)
+        return sha256.hexdigest()
+    except Exception as e:
+        logger.error(f"Failed to calculate hash for {file_path}: {e}")
+        return None
+
+class HashingWriter:
+    """
+    A write-only binary stream that hashes everything written through it.
+
+    Lets content be streamed straight into a file while its SHA-256 hash is computed on the
+    way, instead of assembling the whole content in memory first.
+
+    Args:
+        stream (io.BufferedIOBase): The binary stream to write to.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.sha256 = new_sha256()
+
+    def write(self, data):
+        self.sha256.update(data)
+        return self.stream.write(data)
+
+    def hexdigest(self):
+        return self.sha256.hexdigest()
+
+def read_and_hash(file_path):
+    """
+    Read a file and calculate its SHA-256 hash from the same bytes.
+
+    Used when the content is needed anyway, so the file is read once instead of once for
+    hashing and once more for processing.
+
+    Args:
+        file_path (str): The path to the file to read.
+
+    Returns:
+        tuple: A tuple containing:
+            - data (bytes or None): The content of the file, or None if it could not be read.
+            - file_hash (str or None): The SHA-256 hash of the content in hexadecimal format,
+              or None if the file could not be read.
+    """
+    try:
+        with open(file_path, "rb", buffering=0) as f:
+            data = f.read()
+    except Exception as e:
+        logger.error(f"Failed to read file {file_path}: {e}")
+        return None, None
+    return data, calculate_content_hash(data)
+
+def bulk_sha256(paths, total_size):
+    """
+    Calculate the SHA-256 hashes of many files in one batch.
+
+    Hashing independent files is embarrassingly parallel, but the pool only pays off once there
+    is enough data to hash: batches below PARALLEL_THRESHOLD bytes are hashed inline.
+
+    Args:
+        paths (list): The paths of the files to hash.
+        total_size (int): The combined size of the files in bytes.
+
+    Returns:
+        list: The SHA-256 hashes in hexadecimal format (None for files that could not be read),
+              in the same order as paths.
+    """
+    if total_size < PARALLEL_THRESHOLD:
+        return [calculate_hash(file_path) for file_path in paths]
+    with ProcessPoolExecutor() as executor:
+        return list(executor.map(calculate_hash, paths, chunksize=32))
+
+# ================================ #
+# Hash File
+
+def load_hashes(hash_file):
+    """
+    Load file hashes from a specified hash file.
+
+    This function reads a hash file where each line contains a file path, its hash and the
+    modification time (ns) and size the file had when it was hashed, separated by tab characters.
+    Lines written by older versions carry only the path and the hash. It returns a dictionary
+    mapping the file paths, stored absolute, to (hash, mtime_ns, size) tuples.
+
+    Args:
+        hash_file (str): The path to the hash file.
+
+    Returns:
+        dict: A dictionary where the keys are absolute file paths and the values are (hash, mtime_ns, size)
+              tuples. mtime_ns and size are None for entries without stat information.
+    """
+    hashes = {}
+    if os.path.exists(hash_file):
+        with open(hash_file, "r", encoding="utf-8", newline="") as f:
+            # The C csv reader splits the fields; paths are written unquoted, so disable quoting
+            for row in csv.reader(f, delimiter="\t", quoting=csv.QUOTE_NONE):
+                if len(row) == 2:
+                    file_path, file_hash = row
+                    mtime_ns = size = None
+                elif len(row) == 4 and row[2].isdigit() and row[3].isdigit():
+                    file_path, file_hash = row[:2]
+                    mtime_ns, size = int(row[2]), int(row[3])
+                else:
+                    if row:
+                        line = "\t".join(row)
+                        logger.warning(f"Malformed line in hash file: {line}")
+                    continue
+                # Paths are written absolute (get_markdown_files roots the walk at an absolute path)
+                hashes[file_path] = (file_hash, mtime_ns, size)
+    else:
+        logger.info("Hash file not found. All files will be processed.")
+    return hashes
+
+def save_hashes(hashes, hash_file):
+    """
+    Save the given dictionary of file paths and their corresponding hashes to a specified file.
+
+    Each line holds the path, the hash and the modification time (ns) and size the file had
+    when it was hashed, so later runs can skip re-hashing unchanged files. The file is written
+    to a uniquely named temporary file in the same directory and moved into place, so a failed
+    write never leaves a truncated file and never touches any other file.
+
+    Args:
+        hashes (dict): A dictionary where keys are file paths (str) and values are (hash, mtime_ns, size) tuples.
+        hash_file (str): The path to the file where the hashes will be saved.
+
+    Returns:
+        bool: True if the hashes were saved successfully, False otherwise.
+    """
+    payload = "".join(
+        f"{file_path}\t{file_hash}\t{mtime_ns}\t{size}\n"
+        for file_path, (file_hash, mtime_ns, size) in hashes.items()
+    )
+    try:
+        fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(hash_file)))
+    except OSError as e:
+        logger.error(f"Failed to save hashes: {e}")
+        return False
+    try:
+        with open(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        # mkstemp creates the file readable by the owner only; keep the mode the hash file had,
+        # or give a new one the usual permissions
+        try:
+            shutil.copymode(hash_file, temp_file)
+        except FileNotFoundError:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_file, 0o666 & ~umask)
+        os.replace(temp_file, hash_file)
+        return True
+    except Exception as e:
+        logger.error(f"Failed to save hashes: {e}")
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        return False
+
+# ================================ #
+# Directory Traversal
+
+def get_markdown_files(directory):
+    """
+    Generator function to yield the directory entries of all Markdown files in a given directory.
+
+    The tree is walked with os.scandir so each entry's path and cached stat result can be
+    reused by the caller instead of issuing another stat per file. The root is made absolute
+    once, so every entry path below it is already absolute without a per-file abspath call.
+
+    Args:
+        directory (str): The root directory to search for Markdown files.
+
+    Yields:
+        os.DirEntry: The entry of each Markdown file found in the directory.
+    """
+    return scan_markdown_files(os.path.abspath(directory))
+
+def scan_markdown_files(directory):
+    """
+    Recursively yield the Markdown file entries below a directory, without following directory symlinks.
+
+    Hidden directories and the ones in SKIPPED_DIRECTORIES are not descended into.
+
+    Args:
+        directory (str): The directory to scan. Entry paths are rooted at this path.
+
+    Yields:
+        os.DirEntry: The entry of each Markdown file found in the directory.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if not entry.name.startswith(".") and entry.name not in SKIPPED_DIRECTORIES:
+                        yield from scan_markdown_files(entry.path)
+                elif entry.name.endswith(".md") and entry.is_file():
+                    yield entry
+    except OSError as e:
+        logger.warning(f"Cannot read directory {directory}: {e}")
@@ -2,9 +2,15 @@ import os
 import re
 import shutil
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import MemoryHandler
+from pathlib import Path
 
-# Logging setup
-logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+# Logging setup: records are buffered and written out in batches (errors straight away)
+stream_handler = logging.StreamHandler()
+stream_handler.setFormatter(logging.Formatter('%(asctime)s [%(levelname)s] %(message)s'))
+logging.basicConfig(level=logging.INFO, handlers=[MemoryHandler(capacity=1024, target=stream_handler)])
 
 # Read environment variables or use default values
 posts_dir = os.environ.get("BLOG_POSTS_DIR", "/Volumes/LCS.Data/Blog/CS-Topics/content/posts/")
@@ -25,76 +31,142 @@ pattern = re.compile(r'\[\[([\w\s.-]+\.(?:png|jpg|jpeg|gif|bmp))\]\]', re.IGNORE
 
 # Attempt to get the list of Markdown files in the posts directory
 try:
-    post_files = [f for f in os.listdir(posts_dir) if f.endswith(".md")]
+    # scandir returns the entry type with the names, so no extra stat is needed to skip directories
+    with os.scandir(posts_dir) as entries:
+        post_files = [entry.name for entry in entries if entry.name.endswith(".md") and entry.is_file()]
 except OSError as e:
     logging.error(f"Error reading posts directory: {e}")
     raise SystemExit(1)
 
-if not post_files:
-    logging.warning("No markdown files found in the posts directory.")
-else:
-    for filename in post_files:
-        filepath = os.path.join(posts_dir, filename)
-
-        # Check read access
-        if not os.access(filepath, os.R_OK):
-            logging.warning(f"Cannot read file {filepath}. Skipping.")
-            continue
+# Index the attachments and the images already in the static folder with one directory read
+# each, instead of separate exists/stat calls for every referenced image
+try:
+    with os.scandir(attachments_dir) as entries:
+        attachment_entries = {entry.name: entry for entry in entries if entry.is_file()}
+    with os.scandir(static_images_dir) as entries:
+        static_image_entries = {entry.name: entry for entry in entries}
+except OSError as e:
+    logging.error(f"Error reading images directories: {e}")
+    raise SystemExit(1)
 
-        # Read the file content
-        try:
-            with open(filepath, "r", encoding="utf-8") as file:
-                content = file.read()
-        except OSError as e:
-            logging.error(f"Failed to read {filepath}: {e}")
+# Images already handled by a worker thread in this run
+copied_images = set()
+copied_images_lock = threading.Lock()
+
+def process_post(filename):
+    """
+    Rewrite the image references of a post and copy the referenced images.
+
+    Args:
+        filename (str): The name of the Markdown file inside the posts directory.
+    """
+    filepath = os.path.join(posts_dir, filename)
+
+    # Check read access
+    if not os.access(filepath, os.R_OK):
+        logging.warning(f"Cannot read file {filepath}. Skipping.")
+        return
+
+    # Read the raw bytes in one call
+    try:
+        raw_content = Path(filepath).read_bytes()
+    except OSError as e:
+        logging.error(f"Failed to read {filepath}: {e}")
+        return
+
+    # Cheap substring pre-filter: posts without any wikilink are never decoded nor reach the regex engine
+    if b"[[" not in raw_content:
+        logging.info(f"No images found in {filename}.")
+        return
+
+    # The pattern stays a str one, so image names with non-ASCII letters still match
+    try:
+        content = raw_content.decode("utf-8")
+    except UnicodeDecodeError as e:
+        logging.error(f"Failed to read {filepath}: {e}")
+        return
+
+    # Replace every [[image.png]] with ![Image Description](/images/image.png) in a single
+    # pass over the content, collecting the referenced images along the way
+    images = []
+
+    def to_markdown_image(match):
+        image = match.group(1)
+        # Security check on the image name (no slashes)
+        if '/' in image or '\\' in image:
+            logging.warning(f"Suspicious image name '{image}' in file {filename}. Skipping this image.")
+            return match.group(0)
+        images.append(image)
+        return f"[Image Description](/images/{image.replace(' ', '%20')})"
+
+    updated_content = pattern.sub(to_markdown_image, content)
+
+    if not images:
+        logging.info(f"No images found in {filename}.")
+        return
+
+    # Copy each referenced image to the static folder once
+    for image in dict.fromkeys(images):
+        image_source = os.path.join(attachments_dir, image)
+        source_entry = attachment_entries.get(image)
+        # Names missing from the index are still checked on disk, for case-insensitive file systems
+        if source_entry is None and not os.path.isfile(image_source):
+            logging.warning(f"Image not found: {image_source}, referenced in {filename}.")
             continue
 
-        # Find all images in the content
-        images = pattern.findall(content)
-
-        if not images:
-            logging.info(f"No images found in {filename}.")
+        if not os.access(image_source, os.R_OK):
+            logging.warning(f"Cannot read image: {image_source}. Skipping.")
             continue
 
-        # Update the content with markdown links and copy the images
-        updated_content = content
-        for image in images:
-            # Security check on the image name (no slashes)
-            if '/' in image or '\\' in image:
-                logging.warning(f"Suspicious image name '{image}' in file {filename}. Skipping this image.")
-                continue
-            
-            # Replace [[image.png]] with ![Image Description](/images/image.png)
-            markdown_image = f"[Image Description](/images/{image.replace(' ', '%20')})"
-            updated_content = updated_content.replace(f"[[{image}]]", markdown_image)
-
-            # Copy the image to the static folder
-            image_source = os.path.join(attachments_dir, image)
-            if not os.path.exists(image_source):
-                logging.warning(f"Image not found: {image_source}, referenced in {filename}.")
+        # Another post may reference the same image, only one thread copies it
+        with copied_images_lock:
+            if image in copied_images:
                 continue
+            copied_images.add(image)
 
-            if not os.access(image_source, os.R_OK):
-                logging.warning(f"Cannot read image: {image_source}. Skipping.")
-                continue
+        dest_path = os.path.join(static_images_dir, image)
+        try:
+            # Skip images already copied: same size and modification time as the source
+            source_stat = source_entry.stat() if source_entry is not None else os.stat(image_source)
+            try:
+                dest_entry = static_image_entries.get(image)
+                dest_stat = dest_entry.stat() if dest_entry is not None else os.stat(dest_path)
+                if (dest_stat.st_size, dest_stat.st_mtime_ns) == (source_stat.st_size, source_stat.st_mtime_ns):
+                    logging.info(f"Image {dest_path} is up to date.")
+                    continue
+            except FileNotFoundError:
+                pass
 
-            dest_path = os.path.join(static_images_dir, image)
             try:
-                shutil.copy2(image_source, dest_path)
+                # A hard link shares the data blocks of the source instead of copying them; it only
+                # works on the same file system and when no stale copy is in the way
+                os.link(image_source, dest_path)
+                logging.info(f"Linked {image_source} to {dest_path}")
+            except OSError:
+                # copyfile lets the kernel copy the data (copy_file_range/sendfile, fcopyfile on macOS);
+                # only the timestamps are carried over, which is all the up-to-date check needs
+                shutil.copyfile(image_source, dest_path)
+                os.utime(dest_path, ns=(source_stat.st_atime_ns, source_stat.st_mtime_ns))
                 logging.info(f"Copied {image_source} to {dest_path}")
-            except OSError as e:
-                logging.error(f"Failed to copy {image_source} to {dest_path}: {e}")
+        except OSError as e:
+            logging.error(f"Failed to copy {image_source} to {dest_path}: {e}")
 
-        # Write the updated content to the file, if possible
-        if not os.access(filepath, os.W_OK):
-            logging.warning(f"No write access to {filepath}. File not updated.")
-            continue
+    # Write the updated content to the file, if possible
+    if not os.access(filepath, os.W_OK):
+        logging.warning(f"No write access to {filepath}. File not updated.")
+        return
 
-        try:
-            with open(filepath, "w", encoding="utf-8") as file:
-                file.write(updated_content)
-                logging.info(f"Updated file {filename} successfully.")
-        except OSError as e:
-            logging.error(f"Failed to write to {filepath}: {e}")
+    try:
+        Path(filepath).write_bytes(updated_content.encode("utf-8"))
+        logging.info(f"Updated file {filename} successfully.")
+    except OSError as e:
+        logging.error(f"Failed to write to {filepath}: {e}")
+
+if not post_files:
+    logging.warning("No markdown files found in the posts directory.")
+else:
+    # Posts are independent and the work is I/O-bound, so worker threads overlap the file system calls
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        list(executor.map(process_post, post_files))
 
 logging.info("Markdown files processed and images handled successfully.")
\ No newline at end of file
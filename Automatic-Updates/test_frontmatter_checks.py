@@ -0,0 +1,195 @@
+import logging
+import os
+import tempfile
+import unittest
+
+from hashutil import calculate_content_hash
+from update_frontmatter import (
+    find_missing_fields,
+    get_ruamel_yaml,
+    has_complete_frontmatter,
+    has_complete_raw_frontmatter,
+    needs_frontmatter_update,
+    split_frontmatter,
+    update_categories,
+    update_frontmatter,
+    update_title_and_date,
+)
+
+# Plain and quoted scalars, including the ones YAML 1.1 and 1.2 resolve differently
+# and the zero floats the "clearly non-empty" pattern has to reject
+SCALAR_VALUES = [
+    "Hello", "Hello World", "2024-01-01", "2024-01-01T10:00:00Z", '"x"', "'x'", '" x "',
+    "1", "10", "1e0", "1_000", "1e-999", "1.5e-400", "1.0",
+    "0", "00", "0.", "0e0", "0o0", "0o7", "0x0", "0b0", "+0", "-0",
+    "-.0", "+.0", "._0", "-_0", "+_0", ".0", ".inf", ".nan",
+    "~", "null", "Null", "NULL", "false", "False", "no", "off", "yes", "y", "true",
+    '""', "''", "null # comment",
+]
+
+# Values continued on the next line, where the continuation looks like a top-level key
+MULTI_LINE_FRONTMATTERS = [
+    'description: "A long summary that wraps\ntitle: and continues here"\ndate: 2024-01-01\ncategories:\n  - Math\n',
+    "description: 'A long summary that wraps\ntitle: and continues here'\ndate: 2024-01-01\ncategories:\n  - Math\n",
+    'description: "A long summary that wraps\\\ntitle: and continues here"\ndate: 2024-01-01\ncategories:\n  - Math\n',
+    'notes:\n  - "A note that wraps\ntitle: and continues here"\ndate: 2024-01-01\ncategories:\n  - Math\n',
+    "tags: [a,\ntitle: b]\ndate: 2024-01-01\ncategories:\n  - Math\n",
+]
+
+def ruamel_would_update(frontmatter_text):
+    """
+    Run the round-trip path on the frontmatter and report whether it would change anything.
+    """
+    data = get_ruamel_yaml().load(frontmatter_text)
+    modified = update_title_and_date(data, "post.md")
+    return update_categories(data, "post.md") or modified
+
+class FrontmatterChecksTest(unittest.TestCase):
+    """
+    The fast checks may only report a frontmatter as complete when the round-trip
+    path would leave it unchanged.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def assert_checks_agree(self, frontmatter_text):
+        expected = ruamel_would_update(frontmatter_text)
+        with self.subTest(frontmatter=frontmatter_text):
+            self.assertEqual(needs_frontmatter_update(frontmatter_text), expected)
+            if expected:
+                self.assertFalse(has_complete_frontmatter(frontmatter_text))
+                self.assertFalse(has_complete_raw_frontmatter(frontmatter_text.encode("utf-8")))
+
+    def test_title_values(self):
+        for value in SCALAR_VALUES:
+            self.assert_checks_agree(f"title: {value}\ndate: 2024-01-01\ncategories:\n  - Math\n")
+
+    def test_date_values(self):
+        for value in SCALAR_VALUES:
+            self.assert_checks_agree(f"title: Post\ndate: {value}\ncategories:\n  - Math\n")
+
+    def test_category_values(self):
+        for value in SCALAR_VALUES:
+            self.assert_checks_agree(f"title: Post\ndate: 2024-01-01\ncategories:\n  - {value}\n  - Math\n")
+
+    def test_multi_line_values(self):
+        for frontmatter_text in MULTI_LINE_FRONTMATTERS:
+            with self.subTest(frontmatter=frontmatter_text):
+                self.assertTrue(ruamel_would_update(frontmatter_text))
+                self.assertFalse(has_complete_frontmatter(frontmatter_text))
+                self.assertFalse(has_complete_raw_frontmatter(frontmatter_text.encode("utf-8")))
+                self.assertTrue(needs_frontmatter_update(frontmatter_text))
+
+    def test_complete_frontmatter_is_recognised(self):
+        frontmatter_text = 'title: "Post"\ndate: 2024-01-01\ncategories:\n  - Math\n  - "Computer Science"\n'
+        self.assertTrue(has_complete_frontmatter(frontmatter_text))
+        self.assertTrue(has_complete_raw_frontmatter(frontmatter_text.encode("utf-8")))
+        self.assertFalse(ruamel_would_update(frontmatter_text))
+
+class FrontmatterPatchTest(unittest.TestCase):
+    """
+    Posts whose missing title/date are added as text must load to the same data the
+    round-trip path would produce, and layouts the text patch cannot handle must fall
+    back to it.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        logging.disable(logging.CRITICAL)
+
+    @classmethod
+    def tearDownClass(cls):
+        logging.disable(logging.NOTSET)
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+    def update_post(self, file_name, content):
+        """
+        Write the post, run update_frontmatter on it and return whether it was modified
+        and the resulting content.
+        """
+        file_path = os.path.join(self.directory, file_name)
+        raw_content = content.encode("utf-8")
+        with open(file_path, "wb") as f:
+            f.write(raw_content)
+        modified, new_hash = update_frontmatter(file_path, raw_content)
+        with open(file_path, "rb") as f:
+            written = f.read()
+        if modified:
+            self.assertEqual(new_hash, calculate_content_hash(written))
+        return modified, written.decode("utf-8")
+
+    def assert_same_as_round_trip(self, file_name, frontmatter_text, newline="\n", patched=True):
+        if patched:
+            self.assertTrue(find_missing_fields(frontmatter_text))
+        else:
+            self.assertEqual(find_missing_fields(frontmatter_text), [])
+
+        content = f"---\n{frontmatter_text}\n---\nBody with a [[link]]\n".replace("\n", newline)
+        try:
+            expected = get_ruamel_yaml().load(frontmatter_text)
+        except Exception:
+            # The round-trip path cannot parse it either, so the post must be left alone
+            self.assertEqual(self.update_post(file_name, content), (False, content))
+            return
+        update_title_and_date(expected, file_name)
+        update_categories(expected, file_name)
+
+        modified, written = self.update_post(file_name, content)
+        self.assertTrue(modified)
+        written_frontmatter, written_body = split_frontmatter(written, file_name)
+        self.assertEqual(get_ruamel_yaml().load(written_frontmatter), expected)
+        if patched:
+            # Only the frontmatter is patched; the body is written back byte for byte
+            self.assertEqual(written_body, "\nBody with a [[link]]\n")
+
+    def test_missing_title(self):
+        self.assert_same_as_round_trip("my_post.md", "date: 2024-01-01\ncategories:\n  - Math")
+
+    def test_missing_date(self):
+        self.assert_same_as_round_trip("my_post.md", 'title: "Post"\ncategories:\n  - Math')
+
+    def test_missing_title_and_date(self):
+        self.assert_same_as_round_trip("my_post.md", "author: me\ncategories:\n  - Math\n  - Physics")
+
+    def test_title_needing_escapes(self):
+        self.assert_same_as_round_trip('say_"hi"_to_c:\\temp.md', "date: 2024-01-01\ncategories:\n  - Math")
+
+    def test_crlf_post(self):
+        self.assert_same_as_round_trip("my_post.md", "date: 2024-01-01\ncategories:\n  - Math", newline="\r\n")
+
+    def test_trailing_comment(self):
+        self.assert_same_as_round_trip("my_post.md", "categories:\n  - Math\n# trailing comment")
+        self.assert_same_as_round_trip("my_post.md", "categories:\n  - Math # trailing comment")
+
+    def test_trailing_block_scalar_falls_back(self):
+        self.assert_same_as_round_trip(
+            "my_post.md", "categories:\n  - Math\nsummary: |\n  Some text\n  on two lines", patched=False
+        )
+        self.assert_same_as_round_trip(
+            "my_post.md", "categories:\n  - Math\nsummary: >+ # kept\n  Trailing lines\n", patched=False
+        )
+
+    def test_duplicate_keys_fall_back(self):
+        self.assert_same_as_round_trip("my_post.md", "author: a\nauthor: b\ncategories:\n  - Math", patched=False)
+        self.assert_same_as_round_trip("my_post.md", "date: 2024\ndate: 2025\ncategories:\n  - Math", patched=False)
+
+    def test_empty_title_falls_back(self):
+        self.assert_same_as_round_trip("my_post.md", "title:\ncategories:\n  - Math", patched=False)
+        self.assert_same_as_round_trip("my_post.md", 'title: ""\ncategories:\n  - Math', patched=False)
+
+    def test_continued_flow_mapping_falls_back(self):
+        self.assert_same_as_round_trip("my_post.md", "extra: {a: 1,\nb: 2}\ncategories:\n  - Math", patched=False)
+        self.assert_same_as_round_trip("my_post.md", "extra: {a: 1,\ntitle: b}\ncategories:\n  - Math", patched=False)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -205,7 +205,7 @@ load_file_hashes() {
     
     if [[ -f "$hash_file" ]]; then
         log "Loading file hashes from $hash_file"
-        while IFS=$'\t' read -r file hash || [ -n "$file" ]; do
+        while IFS=$'\t' read -r file hash _ || [ -n "$file" ]; do
             if [[ -n "$file" && -n "$hash" ]]; then
                 file_hashes["$file"]=$hash
             fi
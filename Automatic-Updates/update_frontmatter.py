@@ -2,96 +2,191 @@
 
 import sys
 import os
-import hashlib
-from datetime import datetime
+import re
+import shutil
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
 from ruamel.yaml import YAML
 from ruamel.yaml.scalarstring import DoubleQuotedScalarString
-from io import StringIO
+from logging.handlers import MemoryHandler
+
+from hashutil import HashingWriter, get_markdown_files, load_hashes, read_and_hash, save_hashes
+
+logger = logging.getLogger(__name__)
+
+# Top-level title/date with an inline value that is clearly non-empty: a quoted string with at
+# least one character, or a plain scalar that cannot resolve to null, false or zero: it starts
+# with a letter or a non-zero digit (no sign, dot or underscore, which all allow zero floats)
+# and is not a number with a negative exponent, which can underflow to 0.0
+FM_SCALAR_PATTERN = (
+    r"""^(title|date):[ \t]+"""
+    r"""(?:"[^"]|'[^']|(?!(?:null|Null|NULL|false|False|FALSE|no|No|NO|off|Off|OFF)[ \t]*(?:#|$))"""
+    r"""(?![1-9][\w.]*[eE]-)[A-Za-z1-9])"""
+)
+# Top-level categories holding a block sequence of non-empty, already stripped strings
+FM_CATEGORIES_PATTERN = (
+    r"""^categories:(?:[ \t]+#.*)?[ \t]*\n"""
+    r"""(?:[ \t]*-[ \t]+"""
+    r"""(?:"[^"\\\s](?:[^"\\]*[^"\\\s])?"|'[^'\s](?:[^']*[^'\s])?'"""
+    r"""|(?!(?:null|Null|NULL|true|True|TRUE|false|False|FALSE|yes|Yes|YES|no|No|NO|on|On|ON|off|Off|OFF)[ \t]*(?:#|$))"""
+    r"""[A-Za-z](?:[\w .-]*[\w.])?)"""
+    r"""(?:[ \t]+#.*)?[ \t]*(?:\n|\Z))+"""
+    r"""(?=[^ \t\n-]|\Z)"""
+)
+# A line that cannot leave a quoted scalar or a flow collection open for the next line: indentation
+# and sequence dashes, an optional plain key, then nothing, a closed quoted scalar, a flow collection
+# without quotes or nesting, a block scalar header or a plain scalar, and an optional comment.
+# A line like `title: x` can only be taken for a top-level key when every line passes this check
+FM_PLAIN_SCALAR_PATTERN = r"""[^\s"'#\[\]{}&*!|>%@`?,-](?:[^\n:#]|:(?![ \t]|$)|(?<![ \t])#)*"""
+FM_SINGLE_LINE_PATTERN = (
+    r"""[ \t]*(?:#.*|(?:-(?=[ \t]|$)[ \t]*)*"""
+    rf"""(?:{FM_PLAIN_SCALAR_PATTERN}:(?=[ \t]|$)[ \t]*)?"""
+    r"""(?:"(?:[^"\\\n]|\\.)*"|'(?:[^'\n]|'')*'|\[[^\n\[\]{}"']*\]|\{[^\n\[\]{}"']*\}|[|>][-+]?"""
+    rf"""|{FM_PLAIN_SCALAR_PATTERN})?"""
+    r"""[ \t]*(?:(?<![^ \t\n])#.*)?)"""
+)
+FM_SCALAR_RE = re.compile(FM_SCALAR_PATTERN, re.MULTILINE)
+FM_CATEGORIES_RE = re.compile(FM_CATEGORIES_PATTERN, re.MULTILINE)
+FM_MULTI_LINE_RE = re.compile(rf"^(?!{FM_SINGLE_LINE_PATTERN}$)", re.MULTILINE)
+# The same checks on undecoded frontmatter; only used for ASCII text, where they match exactly the same
+FM_SCALAR_BYTES_RE = re.compile(FM_SCALAR_PATTERN.encode(), re.MULTILINE)
+FM_CATEGORIES_BYTES_RE = re.compile(FM_CATEGORIES_PATTERN.encode(), re.MULTILINE)
+FM_MULTI_LINE_BYTES_RE = re.compile(FM_MULTI_LINE_RE.pattern.encode(), re.MULTILINE)
+# Control characters count as whitespace for str patterns but not for bytes ones (YAML rejects them anyway)
+FM_CONTROL_BYTES_RE = re.compile(rb"[\x00-\x08\x0b-\x1f\x7f]")
+# A top-level block mapping key written as a plain word, e.g. "author:" or "tags: [a, b]"
+FM_TOP_LEVEL_KEY_RE = re.compile(r"([A-Za-z_][\w-]*):(?:[ \t]|$)")
+# A block scalar header, e.g. "summary: |" or "- >-"; appending a line after the content of a
+# trailing block scalar gives it a final line break it did not have
+FM_BLOCK_SCALAR_RE = re.compile(r"(?:^|[ \t])[|>][-+0-9]*[ \t]*(?:#.*)?$", re.MULTILINE)
+
+# The opening frontmatter delimiter, trailing whitespace allowed
+FM_OPENER_PATTERN = r"---[ \t]*\n"
+FM_OPENER_RE = re.compile(FM_OPENER_PATTERN)
+FM_OPENER_BYTES_RE = re.compile(FM_OPENER_PATTERN.encode())
+# The closing frontmatter delimiter is only searched for within this many characters
+FRONTMATTER_SCAN_LIMIT = 64 * 1024
+
+# Date given to every post stamped by this run, in RFC3339 format
+RUN_TIMESTAMP = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+# Underscores in file names become spaces in default titles
+TITLE_TRANSLATION = str.maketrans("_", " ")
+
+# YAML instances are expensive to build and not thread-safe, so each worker thread
+# builds one on first use and reuses it for every file it handles
+thread_local = threading.local()
+
+def get_ruamel_yaml():
+    """
+    Return the round-trip YAML instance of the calling thread, creating it on first use.
 
-# ================================ #
-# Utility Functions
+    Returns:
+        YAML: A ruamel.yaml instance configured to preserve quotes.
+    """
+    yaml = getattr(thread_local, "yaml", None)
+    if yaml is None:
+        yaml = YAML()
+        yaml.preserve_quotes = True
+        thread_local.yaml = yaml
+    return yaml
 
-def calculate_hash(file_path):
+def get_safe_yaml():
     """
-    Calculate the SHA-256 hash of a file.
+    Return the safe-loading YAML instance of the calling thread, creating it on first use.
 
-    Args:
-        file_path (str): The path to the file for which the hash is to be calculated.
+    It resolves scalars exactly like the round-trip instance (YAML 1.2), but builds plain Python
+    objects and uses the C parser when ruamel.yaml.clib is installed, which makes it much faster
+    for read-only checks.
 
     Returns:
-        str: The SHA-256 hash of the file in hexadecimal format if successful.
-        None: If an error occurs during the hash calculation.
+        YAML: A ruamel.yaml instance of type "safe".
     """
-    sha256 = hashlib.sha256()
-    try:
-        with open(file_path, "rb") as f:
-            for block in iter(lambda: f.read(65536), b""):
-                sha256.update(block)
-        return sha256.hexdigest()
-    except Exception as e:
-        print(f"[ERROR] Failed to calculate hash for {file_path}: {e}")
-        return None
+    yaml = getattr(thread_local, "safe_yaml", None)
+    if yaml is None:
+        yaml = YAML(typ="safe")
+        thread_local.safe_yaml = yaml
+    return yaml
 
-def load_hashes(hash_file):
+# ================================ #
+# Logging
+
+class FileLogBuffer(logging.Filter):
     """
-    Load file hashes from a specified hash file.
+    Logger filter that holds back the records a worker thread logs while it processes a file.
 
-    This function reads a hash file where each line contains a file path and its corresponding hash,
-    separated by a tab character. It returns a dictionary mapping absolute file paths to their hashes.
+    The records are kept in the thread's current buffer instead of being handled, so all the
+    lines of one file can be written out together once its result is collected. Records logged
+    outside of a buffered call go through unchanged.
+    """
 
-    Args:
-        hash_file (str): The path to the hash file.
+    def filter(self, record):
+        records = getattr(thread_local, "log_records", None)
+        if records is None:
+            return True
+        records.append(record)
+        return False
 
-    Returns:
-        dict: A dictionary where the keys are absolute file paths and the values are their corresponding hashes.
-    """
-    hashes = {}
-    if os.path.exists(hash_file):
-        with open(hash_file, "r", encoding="utf-8") as f:
-            for line in f:
-                parts = line.strip().split("\t")
-                if len(parts) != 2:
-                    print(f"[WARNING] Malformed line in hash file: {line.strip()}")
-                    continue
-                file_path, file_hash = parts
-                abs_path = os.path.abspath(file_path)
-                hashes[abs_path] = file_hash
-    else:
-        print("[INFO] Hash file not found. All files will be processed.")
-    return hashes
+file_log_buffer = FileLogBuffer()
+logger.addFilter(file_log_buffer)
+logging.getLogger("hashutil").addFilter(file_log_buffer)
 
-def save_hashes(hashes, hash_file):
+def configure_logging():
     """
-    Save the given dictionary of file paths and their corresponding hashes to a specified file.
+    Send log records to stdout through an in-memory buffer.
 
-    Args:
-        hashes (dict): A dictionary where keys are file paths (str) and values are their corresponding hashes (str).
-        hash_file (str): The path to the file where the hashes will be saved.
+    Records are written out in batches of up to 1024 instead of one write per message.
+    Errors are written out immediately.
     """
-    try:
-        with open(hash_file, "w", encoding="utf-8") as f:
-            for file_path, file_hash in hashes.items():
-                f.write(f"{file_path}\t{file_hash}\n")
-    except Exception as e:
-        print(f"[ERROR] Failed to save hashes: {e}")
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("[%(levelname)s] %(message)s"))
+    logging.basicConfig(level=logging.INFO, handlers=[MemoryHandler(capacity=1024, target=stream_handler)])
 
-def read_markdown_file(file_path):
+def flush_logs():
     """
-    Read the content of a Markdown file.
+    Write out any log records still held in memory by the root logger's handlers.
+    """
+    for handler in logging.getLogger().handlers:
+        handler.flush()
+
+# ================================ #
+# Utility Functions
+
+def get_default_title(file_path):
+    """
+    Derive the default title of a post from its file name.
 
     Args:
         file_path (str): The path to the Markdown file.
 
     Returns:
-        str: The content of the file if read successfully, otherwise None.
+        str: The file name without the ".md" extension, with underscores replaced by spaces, in title case.
+    """
+    return os.path.basename(file_path)[:-3].translate(TITLE_TRANSLATION).title()
+
+def decode_markdown_file(raw_content, file_path):
+    """
+    Decode the raw content of a Markdown file, as reading it in text mode would.
+
+    Args:
+        raw_content (bytes): The content of the file, as read from disk.
+        file_path (str): The path to the Markdown file, used for error reporting.
+
+    Returns:
+        str: The decoded content with newlines normalised to "\n" if successful, otherwise None.
     """
     try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            content = f.read()
-        return content
-    except Exception as e:
-        print(f"[ERROR] Failed to read file {file_path}: {e}")
+        content = raw_content.decode("utf-8")
+    except UnicodeDecodeError as e:
+        logger.error(f"Failed to read file {file_path}: {e}")
         return None
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+    return content
 
 def split_frontmatter(content, file_path):
     """
@@ -105,15 +200,230 @@ def split_frontmatter(content, file_path):
         tuple: A tuple containing the frontmatter and the remaining content.
                If no valid frontmatter is found, returns (None, content).
     """
-    if content.startswith("---"):
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            return parts[1], parts[2]
-        else:
-            print(f"[WARNING] Frontmatter delimiter not found correctly in {file_path}.")
-            return None, content
-    else:
+    opener = FM_OPENER_RE.match(content)
+    if opener is None:
+        return None, content
+
+    # Only look for the closing delimiter near the top, instead of scanning the whole body
+    start = opener.end()
+    end = content.find("\n---", start - 1, FRONTMATTER_SCAN_LIMIT)
+    if end < 0:
+        logger.warning(f"Frontmatter delimiter not found correctly in {file_path}.")
         return None, content
+    return content[start:end], content[end + 4:]
+
+def split_raw_frontmatter(raw_content):
+    """
+    Split the frontmatter from the raw content of a file, without decoding it.
+
+    Only plain LF frontmatter is handled; anything that would need newline normalisation
+    is left to the full decode.
+
+    Args:
+        raw_content (bytes): The content of the file, as read from disk.
+
+    Returns:
+        tuple: The encoded frontmatter, which decodes to exactly what split_frontmatter would
+               return for the decoded content, and a memoryview of the bytes following the
+               closing delimiter. If the frontmatter cannot be located on the raw bytes,
+               returns (None, None).
+    """
+    opener = FM_OPENER_BYTES_RE.match(raw_content)
+    if opener is None:
+        return None, None
+    start = opener.end()
+    end = raw_content.find(b"\n---", start - 1, FRONTMATTER_SCAN_LIMIT)
+    if end < 0:
+        return None, None
+    frontmatter = raw_content[start:end]
+    if b"\r" in frontmatter:
+        return None, None
+    return frontmatter, memoryview(raw_content)[end + 4:]
+
+def has_complete_frontmatter(frontmatter_text):
+    """
+    Cheaply check, without parsing YAML, that the frontmatter already has a title, a date
+    and a list of categories.
+
+    Only the common, unambiguous layouts are recognised; anything else is reported as
+    incomplete and left to the YAML-based checks.
+
+    Args:
+        frontmatter_text (str): The text containing the YAML frontmatter.
+
+    Returns:
+        bool: True if the frontmatter certainly needs no update, False if unsure.
+    """
+    # A value continued on the next line (e.g. a wrapped quoted string) can hold text that
+    # looks like a top-level key, so only single-line layouts are trusted
+    if FM_MULTI_LINE_RE.search(frontmatter_text):
+        return False
+    keys = {match.group(1) for match in FM_SCALAR_RE.finditer(frontmatter_text)}
+    return keys == {"title", "date"} and FM_CATEGORIES_RE.search(frontmatter_text) is not None
+
+def has_complete_raw_frontmatter(frontmatter):
+    """
+    Run the has_complete_frontmatter check on frontmatter that has not been decoded yet.
+
+    The byte patterns only agree with the text ones on printable ASCII input, so anything
+    else is reported as incomplete and left to the checks on the decoded text.
+
+    Args:
+        frontmatter (bytes): The encoded frontmatter.
+
+    Returns:
+        bool: True if the frontmatter certainly needs no update, False if unsure.
+    """
+    if not frontmatter.isascii() or FM_CONTROL_BYTES_RE.search(frontmatter):
+        return False
+    if FM_MULTI_LINE_BYTES_RE.search(frontmatter):
+        return False
+    keys = {match.group(1) for match in FM_SCALAR_BYTES_RE.finditer(frontmatter)}
+    return keys == {b"title", b"date"} and FM_CATEGORIES_BYTES_RE.search(frontmatter) is not None
+
+def needs_frontmatter_update(frontmatter_text):
+    """
+    Check whether the frontmatter is missing anything update_frontmatter would add or fix.
+
+    The frontmatter is parsed with ruamel's safe loader, which is much faster than the
+    round-trip parser and resolves values the same way. The round-trip parser is only needed
+    when the file is going to be rewritten, so files that are already complete never reach it.
+
+    Args:
+        frontmatter_text (str): The text containing the YAML frontmatter.
+
+    Returns:
+        bool: False if title, date and categories are all present and valid, True otherwise
+              (including when the text cannot be parsed).
+    """
+    if has_complete_frontmatter(frontmatter_text):
+        return False
+    try:
+        data = get_safe_yaml().load(frontmatter_text)
+    except Exception:
+        return True
+
+    if not isinstance(data, dict) or not data.get("title") or not data.get("date"):
+        return True
+
+    categories = data.get("categories")
+    if not isinstance(categories, list) or not categories:
+        return True
+    return any(not isinstance(cat, str) or not cat.strip() or cat != cat.strip() for cat in categories)
+
+def find_missing_fields(frontmatter_text):
+    """
+    Find the title/date fields that can be added by appending lines to the frontmatter text.
+
+    This covers the common case of a valid frontmatter whose categories are fine but which lacks
+    a title and/or a date key altogether. Everything else (empty or malformed values, block
+    scalars, unusual layouts) is left to the round-trip parser.
+
+    Args:
+        frontmatter_text (str): The text containing the YAML frontmatter.
+
+    Returns:
+        list: The missing keys, in the order they should be appended, if the frontmatter can be
+              patched as text. An empty list if the full YAML round-trip is needed.
+    """
+    if FM_CATEGORIES_RE.search(frontmatter_text) is None or FM_BLOCK_SCALAR_RE.search(frontmatter_text):
+        return []
+
+    keys = set()
+    for line in frontmatter_text.split("\n"):
+        if not line or line[0] in " \t#-":
+            continue
+        match = FM_TOP_LEVEL_KEY_RE.match(line)
+        if match is None or match.group(1) in keys:
+            return []
+        keys.add(match.group(1))
+
+    missing = [key for key in ("title", "date") if key not in keys]
+    present = {match.group(1) for match in FM_SCALAR_RE.finditer(frontmatter_text)}
+    if not missing or not keys.isdisjoint(missing) or {"title", "date"} - set(missing) != present:
+        return []
+
+    # Make sure the line scan agrees with a real parser before touching the file
+    try:
+        data = get_safe_yaml().load(frontmatter_text)
+    except Exception:
+        return []
+    if not isinstance(data, dict) or set(data) != keys:
+        return []
+    return missing
+
+@contextmanager
+def replace_file(file_path):
+    """
+    Context manager that rewrites a file through a temporary file and a hashing writer.
+
+    The new content goes to a uniquely named temporary file next to the real file (the symlink
+    target, if the path is a link, so the link keeps pointing at the updated file), so it never
+    clobbers an existing file nor collides with another worker rewriting the same target. The
+    temporary file gets the permissions of the original and replaces it only once the block
+    completes, so a failure never leaves a half-written file behind.
+
+    Args:
+        file_path (str): The path to the file to rewrite.
+
+    Yields:
+        HashingWriter: The binary stream to write the new content to; its hexdigest() is the
+                       SHA-256 hash of everything written.
+
+    Raises:
+        Exception: If writing fails. The original file is left untouched.
+    """
+    target = os.path.realpath(file_path)
+    fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(target), prefix=f".{os.path.basename(target)}.")
+    try:
+        with open(fd, "wb") as f:
+            yield HashingWriter(f)
+        shutil.copymode(target, temp_file)
+        os.replace(temp_file, target)
+    except BaseException:
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
+        raise
+
+def insert_frontmatter_fields(frontmatter_text, body, missing, file_path):
+    """
+    Add the missing title/date fields to a file by inserting them before the closing delimiter.
+
+    The rest of the file, including the formatting and comments of the existing frontmatter,
+    is written back unchanged.
+
+    Args:
+        frontmatter_text (str): The text of the existing frontmatter.
+        body (bytes or memoryview): The encoded content following the closing delimiter.
+        missing (list): The keys to add, as returned by find_missing_fields.
+        file_path (str): The path to the file.
+
+    Returns:
+        str: The SHA-256 hash of the written content if the file was saved successfully.
+        None: If saving the file failed.
+    """
+    lines = []
+    if "title" in missing:
+        default_title = get_default_title(file_path)
+        escaped_title = default_title.replace("\\", "\\\\").replace('"', '\\"')
+        lines.append(f'\ntitle: "{escaped_title}"')
+        logger.info(f"Added 'title' to {file_path}: {default_title}")
+
+    if "date" in missing:
+        current_date = RUN_TIMESTAMP
+        lines.append(f'\ndate: "{current_date}"')
+        logger.info(f"Added 'date' to {file_path}: {current_date}")
+
+    try:
+        with replace_file(file_path) as writer:
+            writer.write((f"---\n{frontmatter_text}" + "".join(lines) + "\n---").encode("utf-8"))
+            writer.write(body)
+        return writer.hexdigest()
+    except Exception as e:
+        logger.error(f"Failed to save file {file_path}: {e}")
+        return None
 
 def parse_yaml_frontmatter(frontmatter_text, file_path):
     """
@@ -127,13 +437,11 @@ def parse_yaml_frontmatter(frontmatter_text, file_path):
         dict: A dictionary containing the parsed YAML data if successful.
         None: If parsing fails, returns None and prints an error message.
     """
-    yaml = YAML()
-    yaml.preserve_quotes = True
     try:
-        data = yaml.load(frontmatter_text) or {}
+        data = get_ruamel_yaml().load(frontmatter_text) or {}
         return data
     except Exception as e:
-        print(f"[ERROR] Failed to parse YAML for {file_path}: {e}")
+        logger.error(f"Failed to parse YAML for {file_path}: {e}")
         return None
 
 def update_title_and_date(data, file_path):
@@ -149,17 +457,16 @@ def update_title_and_date(data, file_path):
     """
     modified = False
     if "title" not in data or not data["title"]:
-        default_title = os.path.basename(file_path).replace(".md", "").replace("_", " ").title()
+        default_title = get_default_title(file_path)
         data["title"] = DoubleQuotedScalarString(default_title)
         modified = True
-        print(f"[INFO] Added 'title' to {file_path}: {default_title}")
+        logger.info(f"Added 'title' to {file_path}: {default_title}")
 
     if "date" not in data or not data["date"]:
-        # Ensure the date is in RFC3339 format
-        current_date = datetime.utcnow().isoformat() + "Z"
+        current_date = RUN_TIMESTAMP
         data["date"] = DoubleQuotedScalarString(current_date)
         modified = True
-        print(f"[INFO] Added 'date' to {file_path}: {current_date}")
+        logger.info(f"Added 'date' to {file_path}: {current_date}")
     
     return modified
 
@@ -176,29 +483,70 @@ def update_categories(data, file_path):
     """
     modified = False
     if "categories" in data:
-        original_categories = data["categories"]
-        if isinstance(original_categories, list):
-            new_categories = [DoubleQuotedScalarString(cat.strip()) for cat in original_categories if isinstance(cat, str) and cat.strip()]
-            if not new_categories:
+        categories = data["categories"]
+        if isinstance(categories, list):
+            # Fix the list in place, so untouched entries keep their style and comments;
+            # walk it backwards so deleting an entry does not shift the ones still to visit
+            changed = False
+            for index in range(len(categories) - 1, -1, -1):
+                cat = categories[index]
+                stripped = cat.strip() if isinstance(cat, str) else ""
+                if not stripped:
+                    del categories[index]
+                    changed = True
+                elif stripped != cat:
+                    categories[index] = DoubleQuotedScalarString(stripped)
+                    changed = True
+
+            if not categories:
                 del data["categories"]
                 modified = True
-                print(f"[INFO] Removed empty categories from {file_path}.")
-            elif new_categories != original_categories:
-                data["categories"] = new_categories
+                logger.info(f"Removed empty categories from {file_path}.")
+            elif changed:
                 modified = True
-                print(f"[INFO] Updated categories for {file_path}.")
+                logger.info(f"Updated categories for {file_path}.")
         else:
             del data["categories"]
             modified = True
-            print(f"[INFO] Removed invalid 'categories' field from {file_path}.")
+            logger.info(f"Removed invalid 'categories' field from {file_path}.")
 
     if "categories" not in data:
         data["categories"] = [DoubleQuotedScalarString("Uncategorized")]
         modified = True
-        print(f"[INFO] Added default category to {file_path}: Uncategorized")
+        logger.info(f"Added default category to {file_path}: Uncategorized")
 
     return modified
 
+def write_markdown_file(data, body, file_path):
+    """
+    Write frontmatter data and body content to a Markdown file.
+
+    The YAML is dumped straight into the file through a hashing writer, so the content is never
+    assembled in memory. The file is written with replace_file, so a failed dump never leaves a
+    half-written post behind.
+
+    Args:
+        data (dict): The frontmatter data to be written in YAML format.
+        body (bytes or memoryview): The encoded body content to be appended after the frontmatter.
+        file_path (str): The path to the file where the content should be saved.
+
+    Returns:
+        str: The SHA-256 hash of the written content.
+
+    Raises:
+        Exception: If dumping or writing fails. The original file is left untouched.
+    """
+    with replace_file(file_path) as writer:
+        writer.write(b"---\n")
+        get_ruamel_yaml().dump(data, writer)
+        writer.write(b"---\n")
+
+        # Ensure body starts with a newline
+        if body[:1] != b"\n":
+            writer.write(b"\n")
+        writer.write(body)
+    return writer.hexdigest()
+
 def save_frontmatter(data, body, file_path):
     """
     Save the frontmatter and body content to a specified file.
@@ -208,31 +556,18 @@ def save_frontmatter(data, body, file_path):
 
     Args:
         data (dict): The frontmatter data to be written in YAML format.
-        body (str): The body content to be appended after the frontmatter.
+        body (bytes or memoryview): The encoded body content to be appended after the frontmatter.
         file_path (str): The path to the file where the content should be saved.
 
     Returns:
-        bool: True if the file was saved successfully, False otherwise.
+        str: The SHA-256 hash of the written content if the file was saved successfully.
+        None: If saving the file failed.
     """
     try:
-        stream = StringIO()
-        yaml = YAML()
-        yaml.preserve_quotes = True
-        yaml.dump(data, stream)
-        updated_frontmatter = stream.getvalue().rstrip()
-
-        # Ensure body starts with a newline
-        if not body.startswith('\n'):
-            body = '\n' + body
-
-        updated_content = f"---\n{updated_frontmatter}\n---\n{body}"
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(updated_content)
-        return True
+        return write_markdown_file(data, body, file_path)
     except Exception as e:
-        print(f"[ERROR] Failed to save file {file_path}: {e}")
-        return False
+        logger.error(f"Failed to save file {file_path}: {e}")
+        return None
 
 def add_frontmatter_if_missing(data, body, file_path):
     """
@@ -240,132 +575,153 @@ def add_frontmatter_if_missing(data, body, file_path):
 
     Args:
         data (dict): The frontmatter data to create.
-        body (str): The body content of the file.
+        body (bytes or memoryview): The encoded body content of the file.
         file_path (str): The path to the file.
 
     Returns:
-        bool: True if the frontmatter was added, False otherwise.
+        str: The SHA-256 hash of the written content if the frontmatter was added.
+        None: If writing the file failed.
     """
     try:
-        stream = StringIO()
-        yaml = YAML()
-        yaml.preserve_quotes = True
-        yaml.dump(data, stream)
-        frontmatter = stream.getvalue().rstrip()
-
-        # Ensure body starts with a newline
-        if not body.startswith('\n'):
-            body = '\n' + body
-
-        updated_content = f"---\n{frontmatter}\n---\n{body}"
-
-        with open(file_path, "w", encoding="utf-8") as f:
-            f.write(updated_content)
-        print(f"[INFO] Added frontmatter to {file_path}.")
-        return True
+        new_hash = write_markdown_file(data, body, file_path)
+        logger.info(f"Added frontmatter to {file_path}.")
+        return new_hash
     except Exception as e:
-        print(f"[ERROR] Failed to add frontmatter to {file_path}: {e}")
-        return False
+        logger.error(f"Failed to add frontmatter to {file_path}: {e}")
+        return None
 
-def update_frontmatter(file_path):
+def update_frontmatter(file_path, raw_content):
     """
     Update the frontmatter of a Markdown file. Adds frontmatter if missing.
 
     Args:
         file_path (str): The path to the Markdown file to be updated.
+        raw_content (bytes): The current content of the file, as read from disk.
 
     Returns:
-        bool: True if the frontmatter was successfully updated or added, False otherwise.
+        tuple: A tuple containing:
+            - modified (bool): True if the frontmatter was successfully updated or added, False otherwise.
+            - new_hash (str or None): The SHA-256 hash of the rewritten file, computed from the
+              content in memory, or None if the file was not modified.
     """
-    content = read_markdown_file(file_path)
-    if content is None:
-        return False
-
-    frontmatter_text, body = split_frontmatter(content, file_path)
+    # Posts with plain LF frontmatter are split on the raw bytes: only the frontmatter is decoded,
+    # and the body is written back byte for byte if the file needs updating
+    frontmatter, body = split_raw_frontmatter(raw_content)
+    frontmatter_text = None
+    if frontmatter is not None:
+        # Complete frontmatter in the common layout is recognised without decoding anything
+        if has_complete_raw_frontmatter(frontmatter):
+            return False, None
+        try:
+            frontmatter_text = frontmatter.decode("utf-8")
+        except UnicodeDecodeError:
+            pass
+        if frontmatter_text is not None and not needs_frontmatter_update(frontmatter_text):
+            return False, None
+    if frontmatter_text is None or b"\r" in raw_content:
+        # No frontmatter, or line endings to normalise: decode and split the whole file
+        content = decode_markdown_file(raw_content, file_path)
+        if content is None:
+            return False, None
+        frontmatter_text, body = split_frontmatter(content, file_path)
+        body = body.encode("utf-8")
+        if frontmatter_text is not None and not needs_frontmatter_update(frontmatter_text):
+            return False, None
 
     if frontmatter_text is not None:
         # File already has frontmatter, update necessary fields
+
+        # Only title and/or date missing: append them as text instead of round-tripping the YAML
+        missing = find_missing_fields(frontmatter_text)
+        if missing:
+            new_hash = insert_frontmatter_fields(frontmatter_text, body, missing, file_path)
+            return new_hash is not None, new_hash
+
         data = parse_yaml_frontmatter(frontmatter_text, file_path)
         if data is None:
-            return False
+            return False, None
 
         modified = update_title_and_date(data, file_path)
         modified = update_categories(data, file_path) or modified
 
         if not modified:
-            return False
+            return False, None
 
-        return save_frontmatter(data, body, file_path)
+        new_hash = save_frontmatter(data, body, file_path)
+        return new_hash is not None, new_hash
     else:
-        # File does not have frontmatter, create it
+        # File does not have frontmatter, create it with the same defaults used to fill in
+        # missing fields: title from the file name, this run's date and the default category
         data = {}
-        modified = False
-
-        # Add title
-        default_title = os.path.basename(file_path).replace(".md", "").replace("_", " ").title()
-        data["title"] = DoubleQuotedScalarString(default_title)
-        modified = True
-        print(f"[INFO] Added 'title' to {file_path}: {default_title}")
-
-        # Add date in RFC3339 format
-        current_date = datetime.utcnow().isoformat() + "Z"
-        data["date"] = DoubleQuotedScalarString(current_date)
-        modified = True
-        print(f"[INFO] Added 'date' to {file_path}: {current_date}")
-
-        # Add default category
-        data["categories"] = [DoubleQuotedScalarString("Uncategorized")]
-        modified = True
-        print(f"[INFO] Added default category to {file_path}: Uncategorized")
+        update_title_and_date(data, file_path)
+        update_categories(data, file_path)
 
-        return add_frontmatter_if_missing(data, body, file_path) if modified else False
+        new_hash = add_frontmatter_if_missing(data, body, file_path)
+        return new_hash is not None, new_hash
 
-def process_markdown_file(file_path, previous_hash):
+def process_markdown_file(dir_entry, previous_entry):
     """
     Process a Markdown file to update its frontmatter if necessary.
 
+    Files whose modification time and size match the previous entry are assumed unchanged
+    and are not hashed again.
+
     Args:
-        file_path (str): The path to the Markdown file to be processed.
-        previous_hash (str): The hash of the file content before processing.
+        dir_entry (os.DirEntry): The directory entry of the Markdown file to be processed.
+        previous_entry (tuple or None): The (hash, mtime_ns, size) recorded for the file on the previous run.
 
     Returns:
         tuple: A tuple containing:
-            - current_hash (str): The hash of the file content after processing.
+            - entry (tuple or None): The (hash, mtime_ns, size) of the file after processing.
             - file_path (str or None): The file path if the frontmatter was updated, otherwise None.
             - modified (bool): True if the frontmatter was updated, otherwise False.
     """
-    current_hash = calculate_hash(file_path)
+    file_path = dir_entry.path
+    try:
+        st = dir_entry.stat()
+    except OSError as e:
+        logger.error(f"Failed to stat {file_path}: {e}")
+        return None, None, False
+
+    if previous_entry and previous_entry[1:] == (st.st_mtime_ns, st.st_size):
+        return previous_entry, None, False
+
+    # Read once: the same bytes are hashed and, if the file changed, parsed
+    raw_content, current_hash = read_and_hash(file_path)
     if current_hash is None:
         return None, None, False
 
-    if previous_hash == current_hash:
-        return current_hash, None, False
+    current_entry = (current_hash, st.st_mtime_ns, st.st_size)
+    if previous_entry and previous_entry[0] == current_hash:
+        return current_entry, None, False
 
-    print(f"[INFO] Processing: {file_path}")
-    was_modified = update_frontmatter(file_path)
+    logger.info(f"Processing: {file_path}")
+    was_modified, new_hash = update_frontmatter(file_path, raw_content)
 
     if was_modified:
-        new_hash = calculate_hash(file_path)
-        print(f"[INFO] Updated frontmatter for: {file_path}")
-        return new_hash, file_path, True
+        st = os.stat(file_path)
+        logger.info(f"Updated frontmatter for: {file_path}")
+        return (new_hash, st.st_mtime_ns, st.st_size), file_path, True
 
-    print(f"[INFO] No changes needed for: {file_path}")
-    return current_hash, None, False
+    logger.info(f"No changes needed for: {file_path}")
+    return current_entry, None, False
 
-def get_markdown_files(directory):
+def process_markdown_file_buffered(dir_entry, previous_entry):
     """
-    Generator function to yield the absolute paths of all Markdown files in a given directory.
+    Run process_markdown_file, holding back the log records it emits.
 
     Args:
-        directory (str): The root directory to search for Markdown files.
+        dir_entry (os.DirEntry): The directory entry of the Markdown file to be processed.
+        previous_entry (tuple or None): The (hash, mtime_ns, size) recorded for the file on the previous run.
 
-    Yields:
-        str: The absolute path of each Markdown file found in the directory.
+    Returns:
+        tuple: The result of process_markdown_file and the list of log records of the file.
     """
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(".md"):
-                yield os.path.abspath(os.path.join(root, file))
+    thread_local.log_records = records = []
+    try:
+        return process_markdown_file(dir_entry, previous_entry), records
+    finally:
+        thread_local.log_records = None
 
 def print_results(modified_files):
     """
@@ -374,6 +730,8 @@ def print_results(modified_files):
     Args:
         modified_files (list): List of file paths that were modified.
     """
+    # The summary is printed directly, so write out the buffered log lines first
+    flush_logs()
     if modified_files:
         print("\n[INFO] Modified files:")
         for file in modified_files:
@@ -390,21 +748,30 @@ def main(directory, hash_file):
         hash_file (str): The path to the file where hashes are stored.
     """
     directory = os.path.abspath(directory)
-    print(f"[INFO] Processing directory: {directory}")
+    logger.info(f"Processing directory: {directory}")
 
     hashes = load_hashes(hash_file)
     updated_hashes = {}
     modified_files = []
 
-    for file_path in get_markdown_files(directory):
-        new_hash, modified_file, was_modified = process_markdown_file(file_path, hashes.get(file_path))
-        if new_hash:
-            updated_hashes[file_path] = new_hash
-        if was_modified and modified_file:
-            modified_files.append(modified_file)
+    entries = list(get_markdown_files(directory))
+    previous_entries = [hashes.get(dir_entry.path) for dir_entry in entries]
+
+    # Files are processed independently and the work is mostly I/O (stat, read, hash, write), which
+    # releases the GIL; results are collected here on the main thread, so no locking is needed.
+    # Each file's log lines are written out together with its result, so files never interleave
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        results = executor.map(process_markdown_file_buffered, entries, previous_entries)
+        for dir_entry, ((new_entry, modified_file, was_modified), records) in zip(entries, results):
+            for record in records:
+                logging.getLogger(record.name).handle(record)
+            if new_entry:
+                updated_hashes[dir_entry.path] = new_entry
+            if was_modified and modified_file:
+                modified_files.append(modified_file)
 
     save_hashes(updated_hashes, hash_file)
-    print("[INFO] Hash update completed.")
+    logger.info("Hash update completed.")
     print_results(modified_files)
 
 if __name__ == "__main__":
@@ -418,4 +785,5 @@ if __name__ == "__main__":
         print(f"[ERROR] Specified directory does not exist: {target_directory}", file=sys.stderr)
         sys.exit(1)
 
+    configure_logging()
     main(target_directory, hash_file)